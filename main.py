@@ -1,30 +1,43 @@
 import os
+import errno
 import shutil
 import json
 import logging
+import logging.handlers
+import atexit
+import collections
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 import sys
 import platform  # Used to detect the operating system
 import subprocess # Used to open folders on different OSes
 
+try:
+    import ahocorasick  # Optional: faster matching for large "patterns" sections
+except ImportError:
+    ahocorasick = None
+
 # --- 1. Cross-platform Path and Application Settings ---
 
 APP_NAME = "SmartOrganizerPro"
 
-# This is the default config file content that will be created in the user config directory
-DEFAULT_CONFIG_CONTENT = """
-{
-  "file_type_mappings": {
-    "Images": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".tiff"],
-    "Documents": [".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".txt", ".md"],
-    "Archives": [".zip", ".rar", ".7z", ".tar", ".gz"],
-    "Audio": [".mp3", ".wav", ".ogg", ".flac"],
-    "Videos": [".mp4", ".mov", ".avi", ".mkv"],
-    "Scripts": [".py", ".js", ".html", ".css", ".sh", ".json"]
-  }
+# How often (in milliseconds) queued log messages are rendered in the GUI
+LOG_FLUSH_INTERVAL_MS = 100
+
+# This is the default config that will be written to the user config directory
+DEFAULT_CONFIG = {
+    "file_type_mappings": {
+        "Images": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".tiff"],
+        "Documents": [".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".txt", ".md"],
+        "Archives": [".zip", ".rar", ".7z", ".tar", ".gz"],
+        "Audio": [".mp3", ".wav", ".ogg", ".flac"],
+        "Videos": [".mp4", ".mov", ".avi", ".mkv"],
+        "Scripts": [".py", ".js", ".html", ".css", ".sh", ".json"]
+    }
 }
-"""
 
 def get_config_dir():
     """Gets the cross-platform, user-specific configuration folder path."""
@@ -70,7 +83,7 @@ def get_config_file_path():
         # If config.json doesn't exist, create a default one
         try:
             with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(DEFAULT_CONFIG_CONTENT)
+                json.dump(DEFAULT_CONFIG, f, indent=2)
         except Exception as e:
             # Use print() here, as logging might not be initialized yet
             print(f"Failed to create default config file: {e}")
@@ -85,30 +98,121 @@ log_dir = get_log_dir()
 os.makedirs(log_dir, exist_ok=True)
 log_file_path = os.path.join(log_dir, 'organizer.log')
 
-# Configure logging
-logging.basicConfig(
-    filename=log_file_path,
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    encoding='utf-8'
-)
+# Successful moves are logged at DEBUG level; set this to logging.DEBUG to
+# record every moved file instead of just one summary per run
+LOG_LEVEL = logging.INFO
+
+# Configure logging: callers only enqueue records, and a background
+# listener thread writes them to the log file
+file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_record_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_record_queue, file_handler)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(LOG_LEVEL)
+root_logger.addHandler(logging.handlers.QueueHandler(log_record_queue))
+log_listener.start()
+# Flush queued records on every exit path, not just when the window is closed
+atexit.register(log_listener.stop)
 
 # --- 3. Load Configuration from JSON File ---
 
+class Classifier:
+    """
+    Decides which category a file belongs to.
+
+    Extensions are resolved with a single dict lookup. They are short suffixes
+    from a small, fixed set, so a trie or automaton would only add overhead.
+    The optional "patterns" config section (category -> substrings of the
+    filename) is checked first, with an Aho-Corasick automaton when
+    pyahocorasick is installed and a plain scan otherwise.
+    """
+
+    def __init__(self, file_mappings, patterns=None):
+        """
+        :param file_mappings: A dictionary of category -> lowercase extensions.
+        :param patterns: A dictionary of category -> filename substrings.
+        """
+        patterns = patterns or {}
+
+        # Invert the mapping once so each file is classified with a single lookup.
+        # setdefault keeps the first category listed for an extension.
+        ext_to_category = {}
+        for category, extensions in file_mappings.items():
+            for ext in extensions:
+                ext_to_category.setdefault(ext, category)
+        self._lookup_extension = ext_to_category.get
+
+        # pattern -> (priority, category); earlier categories win when several match
+        self._patterns = {}
+        for priority, (category, substrings) in enumerate(patterns.items()):
+            for substring in substrings:
+                if substring:
+                    self._patterns.setdefault(substring.lower(), (priority, category))
+
+        self._automaton = None
+        if self._patterns and ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for pattern, match in self._patterns.items():
+                self._automaton.add_word(pattern, match)
+            self._automaton.make_automaton()
+
+        # Every folder name classify() can return
+        self.categories = (frozenset(file_mappings)
+                           | {category for _, category in self._patterns.values()}
+                           | {'Others'})
+
+    def classify(self, filename):
+        """Returns the category for filename, or 'Others' if nothing matches."""
+        if self._patterns:
+            category = self.match_pattern(filename.lower())
+            if category:
+                return category
+
+        # Same result as os.path.splitext on a bare filename (leading dots do not
+        # start an extension), without scanning for path separators.
+        stem, dot, suffix = filename.rpartition('.')
+        if stem.lstrip('.'):
+            return self._lookup_extension(dot + suffix.lower(), 'Others')
+        # No extension (e.g. 'Makefile', '.hidden'), so nothing to look up
+        return 'Others'
+
+    def match_pattern(self, name):
+        """Returns the category of the highest-priority pattern found in name, or None."""
+        if self._automaton is not None:
+            matches = [match for _, match in self._automaton.iter(name)]
+        else:
+            matches = [match for pattern, match in self._patterns.items() if pattern in name]
+        return min(matches)[1] if matches else None
+
+# Last parsed configuration, reused until config.json changes on disk
+_config_cache = {'path': None, 'mtime': None, 'classifier': None}
+
 def load_config():
-    """Loads file type mapping configuration from the user's config folder."""
+    """
+    Loads file type mapping configuration from the user's config folder.
+
+    :return: A Classifier built from the config, or None on failure.
+    """
     config_file_path = get_config_file_path()
     if not config_file_path:
         logging.error("Config file path could not be determined.")
         return None
 
     try:
+        mtime = os.stat(config_file_path).st_mtime_ns
+        if _config_cache['path'] == config_file_path and _config_cache['mtime'] == mtime:
+            return _config_cache['classifier']
+
         with open(config_file_path, 'r', encoding='utf-8') as f:
             config = json.load(f)
             mappings = config.get("file_type_mappings", {})
             for category, extensions in mappings.items():
                 mappings[category] = [ext.lower() for ext in extensions]
-            return mappings
+            classifier = Classifier(mappings, config.get("patterns", {}))
+            _config_cache.update(path=config_file_path, mtime=mtime, classifier=classifier)
+            return classifier
     except FileNotFoundError:
         logging.error(f"Configuration file '{config_file_path}' not found (this shouldn't happen).")
         return None
@@ -120,12 +224,85 @@ def load_config():
         return None
 
 # --- 4. Core Organization Logic ---
-def organize_folder(folder_path, file_mappings, recursive, update_log_widget):
+
+# Win32 constants used by scandir_win_fast
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+IO_REPARSE_TAG_SYMLINK = 0xA000000C
+FIND_EX_INFO_BASIC = 1
+FIND_EX_SEARCH_NAME_MATCH = 0
+FIND_FIRST_EX_LARGE_FETCH = 2
+ERROR_NO_MORE_FILES = 18
+
+if platform.system() == "Windows":
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.FindFirstFileExW.argtypes = [
+        wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+        ctypes.c_int, ctypes.c_void_p, wintypes.DWORD
+    ]
+    kernel32.FindFirstFileExW.restype = wintypes.HANDLE
+    kernel32.FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+    kernel32.FindNextFileW.restype = wintypes.BOOL
+    kernel32.FindClose.argtypes = [wintypes.HANDLE]
+    kernel32.FindClose.restype = wintypes.BOOL
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+def scandir_entries(path):
+    """Yields (name, is_dir, is_file) for each entry in a folder, using os.scandir."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            yield entry.name, entry.is_dir(follow_symlinks=False), entry.is_file()
+
+def scandir_win_fast(path):
+    """
+    Windows-only equivalent of scandir_entries.
+
+    Calls FindFirstFileExW with FindExInfoBasic, which skips looking up 8.3
+    short names, and FIND_FIRST_EX_LARGE_FETCH, which fetches entries in
+    larger batches. os.scandir uses neither flag.
+    """
+    search_path = os.path.abspath(path)
+    if not search_path.startswith('\\\\'):
+        # Opt out of the MAX_PATH limit, as os.scandir does
+        search_path = '\\\\?\\' + search_path
+    search_path = os.path.join(search_path, '*')
+
+    data = wintypes.WIN32_FIND_DATAW()
+    handle = kernel32.FindFirstFileExW(
+        search_path, FIND_EX_INFO_BASIC, ctypes.byref(data),
+        FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH
+    )
+    if handle == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        while True:
+            name = data.cFileName
+            if name not in ('.', '..'):
+                attributes = data.dwFileAttributes
+                # dwReserved0 holds the reparse tag for reparse points
+                is_symlink = (attributes & FILE_ATTRIBUTE_REPARSE_POINT
+                              and data.dwReserved0 == IO_REPARSE_TAG_SYMLINK)
+                is_dir = bool(attributes & FILE_ATTRIBUTE_DIRECTORY)
+                yield name, is_dir and not is_symlink, not is_dir
+
+            if not kernel32.FindNextFileW(handle, ctypes.byref(data)):
+                error = ctypes.get_last_error()
+                if error != ERROR_NO_MORE_FILES:
+                    raise ctypes.WinError(error)
+                break
+    finally:
+        kernel32.FindClose(handle)
+
+def organize_folder(folder_path, classifier, recursive, update_log_widget):
     """
     The core function that organizes the folder.
 
     :param folder_path: The path of the folder to organize.
-    :param file_mappings: A dictionary of file type mappings.
+    :param classifier: The Classifier that picks each file's category.
     :param recursive: A boolean indicating whether to organize subfolders.
     :param update_log_widget: A function to update the GUI's log widget.
     """
@@ -135,81 +312,170 @@ def organize_folder(folder_path, file_mappings, recursive, update_log_widget):
         update_log_widget(message + "\n")
         return None
 
-    summary_report = {category: 0 for category in file_mappings}
-    summary_report['Others'] = 0
-    total_files_processed = 0
-
-    # Choose the traversal method based on the 'recursive' flag
-    if recursive:
-        # os.walk recursively traverses all subdirectories and files
-        for root, dirs, files in os.walk(folder_path):
-            # Exclude the category folders we create to avoid infinite loops
-            dirs[:] = [d for d in dirs if d not in file_mappings.keys() and d != 'Others']
-            
-            for filename in files:
-                process_file(root, filename, file_mappings, summary_report, update_log_widget)
-                total_files_processed += 1
-    else:
-        # os.listdir only traverses the top-level directory
-        for item_name in os.listdir(folder_path):
-            source_path = os.path.join(folder_path, item_name)
-            if os.path.isfile(source_path):
-                process_file(folder_path, item_name, file_mappings, summary_report, update_log_widget)
-                total_files_processed += 1
-    
-    return summary_report, total_files_processed
+    # Only categories that actually received files get an entry
+    summary_report = collections.Counter()
+
+    # Moves are independent and mostly wait on the filesystem, so run them
+    # concurrently while the scan continues. dest_names maps each destination
+    # folder created during this run to the names it contains; dict.setdefault
+    # and set membership/add are atomic, so workers can share it without a lock.
+    dest_names = {}
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        pending_moves = walk_and_process(
+            folder_path, classifier, recursive,
+            executor, dest_names, update_log_widget
+        )
+        for pending_move in pending_moves:
+            category = pending_move.result()
+            if category:
+                summary_report[category] += 1
+
+    # One summary record per run instead of an INFO line for every moved file
+    details = ", ".join(f"{category}: {count}" for category, count in summary_report.items())
+    logging.info(
+        f"Organized '{folder_path}': {len(pending_moves)} file(s) processed, "
+        f"{sum(summary_report.values())} moved" + (f" ({details})" if details else "")
+    )
+    return summary_report, len(pending_moves)
+
+def walk_and_process(folder_path, classifier, recursive, executor, dest_names, update_log_widget):
+    """
+    Scans each folder once and submits its files to the executor. The listing
+    already reports each entry's type, so no extra stat is needed per entry.
 
-def process_file(current_folder, filename, file_mappings, summary_report, update_log_widget):
-    """Handles the moving logic for a single file."""
-    source_path = os.path.join(current_folder, filename)
-    file_extension = os.path.splitext(filename)[1].lower()
-    
-    moved = False
-    for category, extensions in file_mappings.items():
-        if file_extension in extensions:
-            # All destination folders are created in the current directory
-            dest_folder = os.path.join(current_folder, category)
-            os.makedirs(dest_folder, exist_ok=True)
-            
-            try:
-                # Check if a file with the same name already exists in the destination
-                if not os.path.exists(os.path.join(dest_folder, filename)):
-                    shutil.move(source_path, dest_folder)
-                    message = f"Moved: {filename} -> {category}/"
-                    logging.info(message)
-                    update_log_widget(message + "\n")
-                    summary_report[category] += 1
-                else:
-                    message = f"Skipped (exists): {filename} in {category}/"
-                    logging.warning(message)
-                    update_log_widget(message + "\n")
-                moved = True
-                break
-            except Exception as e:
-                message = f"Error moving {filename}: {e}"
-                logging.error(message)
-                update_log_widget(message + "\n")
-                moved = True # Mark as handled to avoid moving to 'Others'
-                break
-    
-    if not moved:
-        dest_folder = os.path.join(current_folder, 'Others')
-        os.makedirs(dest_folder, exist_ok=True)
+    :return: A list of futures, one per submitted file, each resolving to process_file's result.
+    """
+    list_entries = scandir_win_fast if platform.system() == "Windows" else scandir_entries
+    # Bind the method once rather than resolving classifier.classify for every file
+    classify = classifier.classify
+    # Category folders we create, excluded from the walk to avoid infinite loops
+    category_dirs = classifier.categories
+    pending_moves = []
+    # Walk with an explicit stack instead of recursion to avoid depth limits
+    pending_dirs = [folder_path]
+    while pending_dirs:
+        current_folder = pending_dirs.pop()
+        # Join once per folder; entries are then built by plain concatenation.
+        # os.path.join also copes with folders that already end in a separator.
+        folder_prefix = os.path.join(current_folder, '')
         try:
-            if not os.path.exists(os.path.join(dest_folder, filename)):
-                shutil.move(source_path, dest_folder)
-                message = f"Moved: {filename} -> Others/"
-                logging.info(message)
-                update_log_widget(message + "\n")
-                summary_report['Others'] += 1
-            else:
-                message = f"Skipped (exists): {filename} in Others/"
-                logging.warning(message)
-                update_log_widget(message + "\n")
-        except Exception as e:
-            message = f"Error moving {filename} to 'Others': {e}"
+            # Read the whole listing before any file is moved: directory
+            # iteration is unreliable while workers change the same folder.
+            entries = list(list_entries(current_folder))
+        except OSError as e:
+            # An unreadable target folder fails the whole run; subfolders are skipped
+            if current_folder == folder_path:
+                raise
+            message = f"Error reading folder {current_folder}: {e}"
             logging.error(message)
             update_log_widget(message + "\n")
+            continue
+
+        for name, is_dir, is_file in entries:
+            if is_dir:
+                if recursive and name not in category_dirs:
+                    pending_dirs.append(folder_prefix + name)
+            elif is_file:
+                pending_moves.append(executor.submit(
+                    process_file, folder_prefix, name,
+                    classify, dest_names, update_log_widget
+                ))
+    return pending_moves
+
+def safe_move(source_path, dest_path):
+    """
+    Moves a file to dest_path without overwriting an existing file.
+
+    The destination is claimed atomically instead of being checked first:
+    os.rename refuses to replace a file on Windows, and os.link refuses to
+    on POSIX systems (where os.rename would silently overwrite).
+
+    :return: True if the file was moved, False if the destination already exists.
+    """
+    if os.name == 'nt':
+        try:
+            os.rename(source_path, dest_path)
+        except FileExistsError:
+            return False
+        except OSError as e:
+            # Destinations are subfolders of the source folder, so this should
+            # never cross devices, but keep shutil.move for the odd mount point.
+            if e.errno != errno.EXDEV:
+                raise
+            if os.path.lexists(dest_path):
+                return False
+            shutil.move(source_path, dest_path)
+        return True
+
+    try:
+        os.link(source_path, dest_path, follow_symlinks=False)
+    except FileExistsError:
+        return False
+    except (OSError, NotImplementedError):
+        # Hard links unsupported (e.g. FAT or some network shares):
+        # fall back to a checked rename.
+        if os.path.lexists(dest_path):
+            return False
+        try:
+            os.rename(source_path, dest_path)
+        except OSError as e:
+            # See above: only a cross-device move needs shutil.move
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(source_path, dest_path)
+        return True
+
+    # Linked: drop the original name, or undo the link so the file is not left in both places
+    try:
+        os.unlink(source_path)
+    except OSError:
+        os.unlink(dest_path)
+        raise
+    return True
+
+def process_file(folder_prefix, filename, classify, dest_names, update_log_widget):
+    """
+    Handles the moving logic for a single file.
+
+    :param folder_prefix: The file's folder path, ending with a path separator.
+    :param classify: A function returning the category for a filename.
+    :param dest_names: A dictionary mapping destination folders to the set of names they contain.
+    :return: The category the file was moved to, or None if it was not moved.
+    """
+    source_path = folder_prefix + filename
+    category = classify(filename)
+
+    # All destination folders are created in the current directory
+    dest_folder = folder_prefix + category
+
+    try:
+        existing_names = dest_names.get(dest_folder)
+        if existing_names is None:
+            # First file for this folder: create it and list it once, so duplicates
+            # are detected in memory instead of with a syscall per file
+            os.makedirs(dest_folder, exist_ok=True)
+            existing_names = dest_names.setdefault(dest_folder, set(os.listdir(dest_folder)))
+
+        # Never overwrite a file with the same name in the destination.
+        # safe_move still refuses to overwrite names missing from the listing
+        # (e.g. case-only differences on case-insensitive filesystems).
+        if filename not in existing_names and safe_move(source_path, dest_folder + os.sep + filename):
+            existing_names.add(filename)
+            message = f"Moved: {filename} -> {category}/"
+            logging.debug(message)
+            update_log_widget(message + "\n")
+            return category
+        else:
+            message = f"Skipped (exists): {filename} in {category}/"
+            logging.warning(message)
+            update_log_widget(message + "\n")
+    except Exception as e:
+        if category == 'Others':
+            message = f"Error moving {filename} to 'Others': {e}"
+        else:
+            message = f"Error moving {filename}: {e}"
+        logging.error(message)
+        update_log_widget(message + "\n")
 
 # --- 5. GUI Interface ---
 class OrganizerApp:
@@ -217,6 +483,7 @@ class OrganizerApp:
         self.root = root
         self.root.title("Smart Folder Organizer Pro")
         self.root.geometry("650x450")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Frame for folder selection
         top_frame = tk.Frame(root, padx=10, pady=10)
@@ -237,7 +504,8 @@ class OrganizerApp:
         # --- New Feature Buttons ---
         tk.Button(action_frame, text="Open Config Folder", command=self.open_config_folder).pack(side=tk.LEFT, padx=10)
         
-        tk.Button(action_frame, text="Start Organizing", command=self.start_organization, bg="lightblue", font=('Helvetica', 10, 'bold')).pack(side=tk.RIGHT, padx=10)
+        self.start_button = tk.Button(action_frame, text="Start Organizing", command=self.start_organization, bg="lightblue", font=('Helvetica', 10, 'bold'))
+        self.start_button.pack(side=tk.RIGHT, padx=10)
 
         # ScrolledText for logging output
         log_frame = tk.Frame(root, padx=10, pady=10)
@@ -247,17 +515,53 @@ class OrganizerApp:
         self.log_widget = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD, state='disabled')
         self.log_widget.pack(expand=True, fill=tk.BOTH)
 
+        # Messages waiting to be written to the log widget
+        self._log_queue = collections.deque()
+        # Receives the organize_folder result from the worker thread
+        self._result_queue = queue.Queue()
+        # The thread running the current organization, if any
+        self._worker = None
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+
     def browse_folder(self):
         folder_selected = filedialog.askdirectory()
         if folder_selected:
             self.folder_path_var.set(folder_selected)
 
     def update_log(self, message):
-        self.log_widget.config(state='normal')
-        self.log_widget.insert(tk.END, message)
-        self.log_widget.see(tk.END)
-        self.log_widget.config(state='disabled')
-        self.root.update_idletasks()
+        # Only queue the message; _flush_log writes queued messages in batches
+        self._log_queue.append(message)
+
+    def _flush_log(self):
+        """
+        Writes all queued log messages to the log widget in a single insert,
+        then checks whether the worker thread has finished.
+        """
+        if self._log_queue:
+            batch = []
+            while self._log_queue:
+                batch.append(self._log_queue.popleft())
+            self.log_widget.config(state='normal')
+            self.log_widget.insert(tk.END, ''.join(batch))
+            self.log_widget.see(tk.END)
+            self.log_widget.config(state='disabled')
+
+        # Reschedule before reporting, so the summary is still flushed while
+        # finish_organization's message box is open
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+        try:
+            result = self._result_queue.get_nowait()
+        except queue.Empty:
+            return
+        self.finish_organization(result)
+
+    def on_close(self):
+        """Closes the window, unless an organization is still running."""
+        if self._worker is not None and self._worker.is_alive():
+            # Closing now would abandon the run partway through its file moves
+            messagebox.showwarning("Warning", "Organization is still running. Please wait for it to finish before closing.")
+            return
+        self.root.destroy()
 
     def open_config_folder(self):
         """New: Opens the configuration folder in the system file explorer."""
@@ -276,12 +580,13 @@ class OrganizerApp:
             logging.error(f"Failed to open config folder: {e}")
 
     def start_organization(self):
+        self._log_queue.clear()
         self.log_widget.config(state='normal')
         self.log_widget.delete('1.0', tk.END)
         self.log_widget.config(state='disabled')
 
-        file_mappings = load_config()
-        if file_mappings is None:
+        classifier = load_config()
+        if classifier is None:
             message = "Fatal Error: Could not load config.json. Check logs for details."
             self.update_log(message + "\n")
             messagebox.showerror("Error", message)
@@ -299,9 +604,31 @@ class OrganizerApp:
         self.update_log(f"Recursive Mode: {'On' if is_recursive else 'Off'}\n")
         self.update_log(f"Log file location: {log_file_path}\n")
         self.update_log("--------------------\n")
-        
-        result = organize_folder(folder_path, file_mappings, is_recursive, self.update_log)
 
+        # Organize on a worker thread so the GUI stays responsive;
+        # _flush_log picks up the result from the main thread.
+        self.start_button.config(state='disabled')
+        self._worker = threading.Thread(
+            target=self._run_organization,
+            args=(folder_path, classifier, is_recursive),
+            daemon=True
+        )
+        self._worker.start()
+
+    def _run_organization(self, folder_path, classifier, is_recursive):
+        """Runs organize_folder on the worker thread. Must not touch any widgets."""
+        try:
+            result = organize_folder(folder_path, classifier, is_recursive, self.update_log)
+        except Exception as e:
+            message = f"Unexpected error during organization: {e}"
+            logging.error(message)
+            self.update_log(message + "\n")
+            result = None
+        self._result_queue.put(result)
+
+    def finish_organization(self, result):
+        """Reports the outcome of a finished organization run."""
+        self.start_button.config(state='normal')
         if result:
             summary_report, total_files = result
             summary_message = "\n--------------------\nOrganization Complete!\n"